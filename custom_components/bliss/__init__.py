@@ -1,6 +1,8 @@
 """Support for Bliss blinds."""
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_DEVICES
 from homeassistant.core import HomeAssistant
@@ -17,21 +19,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(CONF_DEVICES, {})
 
+    device_registry = dr.async_get(hass)
+    coordinators: dict[str, BlissBlindCoordinator] = {}
     for device_id, conf in entry.data.get(CONF_DEVICES, {}).items():
-        device_registry = dr.async_get(hass)
         device = device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
             identifiers={(DOMAIN, conf[CONF_MAC])},
             name=conf[CONF_NAME],
         )
-
-        coordinator = BlissBlindCoordinator(hass, device.id, conf)
-        await coordinator.async_config_entry_first_refresh()
+        coordinators[device_id] = BlissBlindCoordinator(hass, device.id, conf)
+
+    # Connect to all blinds in parallel; a single slow or unreachable device
+    # should not serialize startup for the others.
+    results = await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators.values()
+        ),
+        return_exceptions=True,
+    )
+    for (device_id, coordinator), result in zip(coordinators.items(), results):
+        if isinstance(result, Exception):
+            LOGGER.warning(
+                "Initial refresh failed for %s (%s), will retry on next update",
+                coordinator.device_name,
+                result,
+            )
         hass.data[DOMAIN][CONF_DEVICES][device_id] = coordinator
 
-    hass.async_create_task(
-        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
     return True
@@ -70,30 +86,36 @@ async def async_remove_config_entry_device(
     """Remove entities and device from Home Assistant when the device is removed."""
     device_id = device_entry.id
     ent_reg = er.async_get(hass)
-    reg_entities: dict[str, str] = {}
-    for ent in er.async_entries_for_config_entry(ent_reg, config_entry.entry_id):
-        if device_id == ent.device_id:
-            reg_entities[ent.unique_id] = ent.entity_id
-    for entity_id in reg_entities.values():
-        ent_reg.async_remove(entity_id)
+    reg_entries = er.async_entries_for_config_entry(ent_reg, config_entry.entry_id)
+    for reg_entry in reg_entries:
+        if reg_entry.device_id == device_id:
+            ent_reg.async_remove(reg_entry.entity_id)
 
     dev_reg = dr.async_get(hass)
     dev_reg.async_remove_device(device_id)
 
-    devices_to_remove: list[str] = []
-    for dev_id, dev_config in config_entry.data.get(CONF_DEVICES, {}).items():
-        if dev_config[CONF_NAME] == device_entry.name:
-            devices_to_remove.append(dev_config[CONF_MAC])
-
-    new_data = {CONF_DEVICES: dict(config_entry.data.get(CONF_DEVICES, {}))}
-    for mac in devices_to_remove:
-        new_data[CONF_DEVICES].pop(mac, None)
+    # The registry entry was created with (DOMAIN, mac) identifiers, so the
+    # MACs to drop can be read straight off the device instead of scanning
+    # the config entry for a matching (and possibly duplicated) name.
+    macs_to_remove = {
+        identifier[1]
+        for identifier in device_entry.identifiers
+        if identifier[0] == DOMAIN
+    }
+
+    new_data = {
+        **config_entry.data,
+        CONF_DEVICES: {
+            mac: dev_config
+            for mac, dev_config in config_entry.data.get(CONF_DEVICES, {}).items()
+            if mac not in macs_to_remove
+        },
+    }
 
     hass.config_entries.async_update_entry(config_entry, data=new_data)
-    hass.config_entries._async_schedule_save()
 
     domain_data = hass.data.get(DOMAIN, {}).get(CONF_DEVICES, {})
-    for mac in devices_to_remove:
+    for mac in macs_to_remove:
         domain_data.pop(mac, None)
 
     return True
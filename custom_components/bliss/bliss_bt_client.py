@@ -6,7 +6,6 @@ import struct
 from collections.abc import Callable
 from datetime import datetime
 
-import async_timeout
 from bleak import BleakClient, BleakGATTCharacteristic, BLEDevice
 from bleak.exc import BleakError
 
@@ -17,6 +16,9 @@ from .const import BLISS_NAME_PATTERN, LOGGER
 COMMAND_UUID = "00010405-0405-0607-0809-0a0b0c0d1910"
 RESPONSE_UUID = "00010304-0405-0607-0809-0a0b0c0d1910"
 
+HEADER = b"\xff\x78\xea\x41"
+_UNPACK_POS = struct.Struct("<H").unpack_from
+
 PWD_PREFIX = bytes([0xFF, 0x03, 0x03, 0x03, 0x03])
 GOTO_PREFIX = bytes([0xFF, 0x78, 0xEA, 0x41, 0xBF, 0x03])
 SET_TIME_PREFIX = bytes([0xFF, 0x78, 0xEA, 0x41, 0x02, 0x00])
@@ -31,17 +33,15 @@ def build_login(password: str) -> bytes:
 
 def build_set_time(now: datetime | None = None) -> bytes:
     now = now or datetime.now()
-    payload = bytes(
-        [
-            (now.year - 2000) & 0xFF,
-            now.month & 0xFF,
-            now.day & 0xFF,
-            now.hour & 0xFF,
-            now.minute & 0xFF,
-            now.second & 0xFF,
-        ]
+    return SET_TIME_PREFIX + struct.pack(
+        "<BBBBBB",
+        (now.year - 2000) & 0xFF,
+        now.month,
+        now.day,
+        now.hour,
+        now.minute,
+        now.second,
     )
-    return SET_TIME_PREFIX + payload
 
 
 def build_move_command(position: int, *, prefix: bytes = GOTO_PREFIX) -> bytes:
@@ -64,16 +64,28 @@ class BlissBlindClient:
         self._hass = hass
         self._address = address.upper()
         self._password = password
+        self._login_packet = build_login(password)
         self._range_max = range_max
         self._status_callback = status_callback
 
         self._ble_device: BLEDevice | None = None
         self._bt_client: BleakClient | None = None
+        self._cmd_char: BleakGATTCharacteristic | str = COMMAND_UUID
+        self._resp_char: BleakGATTCharacteristic | str = RESPONSE_UUID
 
         self._position_device_units: int | None = None
         self._available = False
         self._busy = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
         self._status_event = asyncio.Event()
+        self._pending_ack: dict[int, asyncio.Future[bytes]] = {}
+        self._pending_target: int | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._state_cache: dict = {
+            "available": False,
+            "position": None,
+            "raw_position": None,
+        }
 
     @property
     def available(self) -> bool:
@@ -94,7 +106,11 @@ class BlissBlindClient:
     async def ensure_connected(self) -> None:
         if self._bt_client and self._bt_client.is_connected:
             return
-        await self._connect()
+        async with self._connect_lock:
+            # A concurrent caller may have connected while we waited.
+            if self._bt_client and self._bt_client.is_connected:
+                return
+            await self._connect()
 
     async def _connect(self) -> None:
         if self._bt_client and self._bt_client.is_connected:
@@ -110,23 +126,42 @@ class BlissBlindClient:
 
         LOGGER.debug("Connecting to Bliss blind %s", self._address)
         self._bt_client = BleakClient(self._ble_device)
-        try:
-            await self._bt_client.connect()
-        except BleakError as err:
-            self._bt_client = None
-            raise err
-
-        await self._bt_client.start_notify(RESPONSE_UUID, self._notification_handler)
+        for attempt in range(3):
+            try:
+                await self._bt_client.connect(timeout=20.0)
+                break
+            except BleakError as err:
+                if attempt == 2:
+                    self._bt_client = None
+                    raise err
+                LOGGER.debug(
+                    "Connect attempt %s to %s failed (%s), retrying",
+                    attempt + 1,
+                    self._address,
+                    err,
+                )
+                await asyncio.sleep(min(2**attempt, 8))
+
+        # Resolve the characteristics once so later writes skip Bleak's
+        # per-call UUID lookup.
+        services = self._bt_client.services
+        self._cmd_char = services.get_characteristic(COMMAND_UUID) or COMMAND_UUID
+        self._resp_char = services.get_characteristic(RESPONSE_UUID) or RESPONSE_UUID
+
+        await self._bt_client.start_notify(self._resp_char, self._notification_handler)
         await self._initialize()
         self._available = True
 
     async def disconnect(self) -> None:
         client = self._bt_client
+        resp_char = self._resp_char
         self._bt_client = None
+        self._cmd_char = COMMAND_UUID
+        self._resp_char = RESPONSE_UUID
         if client and client.is_connected:
             LOGGER.debug("Disconnecting Bliss blind %s", self._address)
             try:
-                await client.stop_notify(RESPONSE_UUID)
+                await client.stop_notify(resp_char)
             except BleakError:
                 pass
             try:
@@ -136,8 +171,7 @@ class BlissBlindClient:
         self._available = False
 
     async def _initialize(self) -> None:
-        await self._send_command(build_login(self._password), "login")
-        await asyncio.sleep(0.1)
+        await self._send_command(self._login_packet, "login")
         await self._send_command(build_set_time(), "set_clock")
 
     async def refresh_status(self) -> None:
@@ -145,7 +179,7 @@ class BlissBlindClient:
         self._status_event.clear()
         await self._send_command(READ_STATUS, "read_status")
         try:
-            async with async_timeout.timeout(2):
+            async with asyncio.timeout(2):
                 await self._status_event.wait()
         except asyncio.TimeoutError:
             LOGGER.debug("Timeout waiting for status from %s", self._address)
@@ -154,10 +188,26 @@ class BlissBlindClient:
         fraction = max(0.0, min(1.0, fraction))
         await self.ensure_connected()
         device_position = round(self._range_max * (1.0 - fraction))
-        await self._send_command(build_move_command(device_position), "move")
-        self._position_device_units = device_position
-        if self._status_callback:
-            self._status_callback(self._build_state())
+        # Overwrite-latest semantics: a burst of calls (e.g. a UI slider
+        # drag) just replaces the pending target, and the single writer
+        # task only sends the newest value instead of queueing them all.
+        self._pending_target = device_position
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_pending_moves())
+
+    async def _drain_pending_moves(self) -> None:
+        while (target := self._pending_target) is not None:
+            self._pending_target = None
+            try:
+                await self._send_command(
+                    build_move_command(target), "move", expect_opcode=0xBF
+                )
+            except BleakError as err:
+                LOGGER.warning("Move command to %s failed: %s", self._address, err)
+                return
+            self._position_device_units = target
+            if self._status_callback:
+                self._status_callback(self._refresh_state_cache())
 
     async def set_cover_percentage(self, percentage: int) -> None:
         await self.set_cover_fraction(percentage / 100)
@@ -168,25 +218,51 @@ class BlissBlindClient:
     async def close_cover(self) -> None:
         await self.set_cover_fraction(0.0)
 
-    def _build_state(self) -> dict:
-        return {
-            "available": self._available,
-            "position": self.position_percentage,
-            "raw_position": self._position_device_units,
-        }
+    def _refresh_state_cache(self) -> dict:
+        """Update the shared state dict in place and return it.
+
+        The same dict instance is reused for every callback to avoid
+        allocating during notification bursts; callers must not hold on
+        to it across updates.
+        """
+        cache = self._state_cache
+        cache["available"] = self._available
+        cache["position"] = self.position_percentage
+        cache["raw_position"] = self._position_device_units
+        return cache
 
     @property
     def state(self) -> dict:
-        """Return the latest known state dictionary."""
-        return self._build_state()
+        """Return a copy of the latest known state dictionary."""
+        return dict(self._refresh_state_cache())
 
-    async def _send_command(self, data: bytes, label: str) -> None:
+    async def _send_command(
+        self, data: bytes, label: str, expect_opcode: int | None = None
+    ) -> None:
         if not self._bt_client:
             raise BleakError("Not connected")
         async with self._busy:
             LOGGER.debug("→ %s: %s", label, data.hex(" "))
-            await self._bt_client.write_gatt_char(COMMAND_UUID, data, response=True)
-            await asyncio.sleep(0.1)
+            if expect_opcode is None:
+                await self._bt_client.write_gatt_char(
+                    self._cmd_char, data, response=True
+                )
+                # No distinct ack for this command; give the device a beat
+                # before the next write.
+                await asyncio.sleep(0.02)
+                return
+
+            ack: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+            self._pending_ack[expect_opcode] = ack
+            try:
+                await self._bt_client.write_gatt_char(
+                    self._cmd_char, data, response=True
+                )
+                await asyncio.wait_for(ack, timeout=1.0)
+            except asyncio.TimeoutError:
+                LOGGER.debug("No %s ack from %s", label, self._address)
+            finally:
+                self._pending_ack.pop(expect_opcode, None)
 
     def _notification_handler(
         self, characteristic: BleakGATTCharacteristic, data: bytearray
@@ -197,31 +273,25 @@ class BlissBlindClient:
             characteristic.uuid,
             data.hex(" "),
         )
-        if len(data) >= 8 and data[0:4] == b"\xFFx\xEA\x41":
-            command = data[4]
-            if command == 0xD1 and len(data) >= 9:
-                position = int.from_bytes(data[6:8], "little", signed=False)
-                self._position_device_units = position
-                if self._status_callback:
-                    self._status_callback(self._build_state())
-                self._status_event.set()
-        # Some devices acknowledge movement on a different opcode
-        if len(data) >= 8 and data[0:4] == b"\xFFx\xEA\x41" and data[4] == 0xBF:
-            if len(data) >= 9:
-                position = int.from_bytes(data[6:8], "little", signed=False)
-                self._position_device_units = position
-                if self._status_callback:
-                    self._status_callback(self._build_state())
-
-    @staticmethod
-    async def async_discover(timeout: float = 10.0) -> list[tuple[str, str]]:
+        if len(data) < 9 or data[:4] != HEADER:
+            return
+        opcode = data[4]
+        ack = self._pending_ack.pop(opcode, None)
+        if ack and not ack.done():
+            ack.set_result(bytes(data))
+        # 0xD1 is a status report; 0xBF is a move ack carrying the same
+        # position payload. Both are authoritative position updates.
+        if opcode in (0xD1, 0xBF):
+            self._position_device_units = _UNPACK_POS(data, 6)[0]
+            if self._status_callback:
+                self._status_callback(self._refresh_state_cache())
+            self._status_event.set()
+
+    async def async_discover(self) -> list[tuple[str, str]]:
         """Discover nearby Bliss blinds using Bluetooth information from HA."""
-        infos = bluetooth.async_discovered_service_info()
-        matches: list[tuple[str, str]] = []
-        for info in infos:
-            if not info.connectable:
-                continue
-            name = info.name or ""
-            if BLISS_NAME_PATTERN.match(name):
-                matches.append((name, info.address))
-        return matches
+        _match = BLISS_NAME_PATTERN.match
+        return [
+            (info.name, info.address)
+            for info in bluetooth.async_discovered_service_info(self._hass)
+            if info.connectable and info.name and _match(info.name)
+        ]
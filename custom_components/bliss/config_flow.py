@@ -53,10 +53,20 @@ class BlissConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     def _get_existing_entry(self) -> ConfigEntry | None:
         if self.hass is None:
             return None
-        for entry in self.hass.config_entries.async_entries(DOMAIN):
-            if entry.title == CONFIG_ENTRY_TITLE:
-                return entry
-        return None
+        entries = self.hass.config_entries
+        if hasattr(entries, "async_entry_for_domain_unique_id"):
+            return entries.async_entry_for_domain_unique_id(
+                DOMAIN, CONFIG_ENTRY_TITLE
+            )
+        # Older cores: match on unique_id, which survives entry renames.
+        return next(
+            (
+                entry
+                for entry in entries.async_entries(DOMAIN)
+                if entry.unique_id == CONFIG_ENTRY_TITLE
+            ),
+            None,
+        )
 
     def _device_exists(self, mac: str) -> bool:
         entry = self._get_existing_entry()
@@ -127,11 +137,15 @@ class BlissConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                         description_placeholders={"dev_name": new_device_data[CONF_NAME]},
                     )
 
-                new_data = {CONF_DEVICES: dict(entry.data.get(CONF_DEVICES, {}))}
-                new_data[CONF_DEVICES][formatted_mac] = new_device_data
+                new_data = {
+                    **entry.data,
+                    CONF_DEVICES: {
+                        **entry.data.get(CONF_DEVICES, {}),
+                        formatted_mac: new_device_data,
+                    },
+                }
 
                 self.hass.config_entries.async_update_entry(entry, data=new_data)
-                self.hass.config_entries._async_schedule_save()
                 await self.hass.config_entries.async_reload(entry.entry_id)
 
                 return self.async_abort(
@@ -150,6 +164,21 @@ class BlissOptionsFlowHandler(OptionsFlow):
         self.config_entry = config_entry
         self.selected_device: str | None = None
         self.device_data = DEVICE_DATA.copy()
+        self._devices_version = 0
+        self._select_schema_cache: tuple[int, vol.Schema] | None = None
+
+    def _get_select_schema(self) -> vol.Schema:
+        """Return the device selection schema, rebuilt only after mutations."""
+        cached = self._select_schema_cache
+        if cached is not None and cached[0] == self._devices_version:
+            return cached[1]
+        devices = {
+            mac: data[CONF_NAME]
+            for mac, data in self.config_entry.data.get(CONF_DEVICES, {}).items()
+        }
+        schema = get_device_schema_select(devices)
+        self._select_schema_cache = (self._devices_version, schema)
+        return schema
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         if user_input is not None:
@@ -190,15 +219,19 @@ class BlissOptionsFlowHandler(OptionsFlow):
                 errors["base"] = "cannot_connect"
 
             if not errors:
-                new_data = {CONF_DEVICES: dict(self.config_entry.data.get(CONF_DEVICES, {}))}
-                device_data = dict(user_input)
-                device_data[CONF_MAC] = formatted_mac
-                new_data[CONF_DEVICES][formatted_mac] = device_data
+                device_data = {**user_input, CONF_MAC: formatted_mac}
+                new_data = {
+                    **self.config_entry.data,
+                    CONF_DEVICES: {
+                        **self.config_entry.data.get(CONF_DEVICES, {}),
+                        formatted_mac: device_data,
+                    },
+                }
 
                 self.hass.config_entries.async_update_entry(
                     self.config_entry, data=new_data
                 )
-                self.hass.config_entries._async_schedule_save()
+                self._devices_version += 1
                 await self.hass.config_entries.async_reload(self.config_entry.entry_id)
 
                 return self.async_abort(
@@ -221,33 +254,35 @@ class BlissOptionsFlowHandler(OptionsFlow):
             )
             return await self.async_step_edit_device()
 
-        devices = {
-            mac: data[CONF_NAME]
-            for mac, data in self.config_entry.data.get(CONF_DEVICES, {}).items()
-        }
         return self.async_show_form(
             step_id="select_edit_device",
-            data_schema=get_device_schema_select(devices),
+            data_schema=self._get_select_schema(),
         )
 
     async def async_step_edit_device(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
         if user_input is not None and self.selected_device is not None:
-            new_data = {CONF_DEVICES: dict(self.config_entry.data.get(CONF_DEVICES, {}))}
-            entry = new_data[CONF_DEVICES][self.selected_device]
-            entry[CONF_NAME] = user_input[CONF_NAME]
-            entry[CONF_PASSWORD] = user_input[CONF_PASSWORD]
-            entry[CONF_RANGE_MAX] = int(user_input[CONF_RANGE_MAX])
+            devices = self.config_entry.data.get(CONF_DEVICES, {})
+            device_data = {
+                **devices[self.selected_device],
+                CONF_NAME: user_input[CONF_NAME],
+                CONF_PASSWORD: user_input[CONF_PASSWORD],
+                CONF_RANGE_MAX: int(user_input[CONF_RANGE_MAX]),
+            }
+            new_data = {
+                **self.config_entry.data,
+                CONF_DEVICES: {**devices, self.selected_device: device_data},
+            }
 
             self.hass.config_entries.async_update_entry(
                 self.config_entry, data=new_data
             )
-            self.hass.config_entries._async_schedule_save()
+            self._devices_version += 1
             await self.hass.config_entries.async_reload(self.config_entry.entry_id)
 
             return self.async_abort(
                 reason="edit_success",
-                description_placeholders={"dev_name": entry[CONF_NAME]},
+                description_placeholders={"dev_name": device_data[CONF_NAME]},
             )
 
         return self.async_show_form(
@@ -262,14 +297,19 @@ class BlissOptionsFlowHandler(OptionsFlow):
     ) -> FlowResult:
         if user_input is not None:
             mac = user_input[SELECTED_DEVICE]
-            devices = {CONF_DEVICES: dict(self.config_entry.data.get(CONF_DEVICES, {}))}
-            device_name = devices[CONF_DEVICES][mac][CONF_NAME]
-            devices[CONF_DEVICES].pop(mac)
+            devices = self.config_entry.data.get(CONF_DEVICES, {})
+            device_name = devices[mac][CONF_NAME]
+            new_data = {
+                **self.config_entry.data,
+                CONF_DEVICES: {
+                    dev_mac: data for dev_mac, data in devices.items() if dev_mac != mac
+                },
+            }
 
             self.hass.config_entries.async_update_entry(
-                self.config_entry, data=devices
+                self.config_entry, data=new_data
             )
-            self.hass.config_entries._async_schedule_save()
+            self._devices_version += 1
             await self._async_remove_device(mac)
 
             return self.async_abort(
@@ -277,13 +317,9 @@ class BlissOptionsFlowHandler(OptionsFlow):
                 description_placeholders={"dev_name": device_name},
             )
 
-        devices = {
-            mac: data[CONF_NAME]
-            for mac, data in self.config_entry.data.get(CONF_DEVICES, {}).items()
-        }
         return self.async_show_form(
             step_id="remove_device",
-            data_schema=get_device_schema_select(devices),
+            data_schema=self._get_select_schema(),
         )
 
     async def _async_remove_device(self, mac: str) -> None:
@@ -17,6 +17,6 @@ CONF_RANGE_MAX = "range_max"
 DEFAULT_PASSWORD = "123456"
 DEFAULT_RANGE_MAX = 1000
 
-BLISS_NAME_PATTERN = re.compile(r"^(HD|TS)\\d{4}$")
+BLISS_NAME_PATTERN = re.compile(r"^(?:HD|TS)\d{4}$")
 
 LOGGER = logging.getLogger(__package__)
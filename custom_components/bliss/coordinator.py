@@ -1,6 +1,7 @@
 """Coordinator for Bliss blind devices."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
 from bleak.exc import BleakError
@@ -14,6 +15,7 @@ from .const import (
     CONF_RANGE_MAX,
     DEFAULT_PASSWORD,
     DEFAULT_RANGE_MAX,
+    DOMAIN,
     LOGGER,
 )
 
@@ -27,12 +29,19 @@ class BlissBlindCoordinator(DataUpdateCoordinator[dict]):
         self.address = conf[CONF_MAC]
         self.password = conf.get(CONF_PASSWORD, DEFAULT_PASSWORD)
         self.range_max = int(conf.get(CONF_RANGE_MAX, DEFAULT_RANGE_MAX))
+        # Shared by every entity of this device so the registry hashes a
+        # single identifiers set instead of one copy per entity.
+        self.device_info_dict = {
+            "identifiers": frozenset({(DOMAIN, self.address)}),
+            "name": self.device_name,
+        }
 
         super().__init__(
             hass,
             LOGGER,
             name=f"Bliss Blind: {self.device_name}",
             update_interval=timedelta(minutes=5),
+            always_update=False,
         )
 
         self._client = BlissBlindClient(
@@ -47,10 +56,26 @@ class BlissBlindCoordinator(DataUpdateCoordinator[dict]):
             "available": False,
             "position": None,
             "raw_position": None,
+            "is_closed": None,
         }
-
-    async def _handle_status_update(self, state: dict) -> None:
+        self._pending_dispatch: asyncio.TimerHandle | None = None
+        self._pending_percent: int | None = None
+        self._percent_debounce: asyncio.TimerHandle | None = None
+
+    def _handle_status_update(self, state: dict) -> None:
+        # A moving blind emits a stream of intermediate positions; merge
+        # them into self.data immediately but fan out to listeners at
+        # most every 50ms. The final notification is always dispatched.
         self.data.update(state)
+        position = self.data.get("position")
+        self.data["is_closed"] = None if position is None else position <= 0
+        if self._pending_dispatch is None:
+            self._pending_dispatch = self.hass.loop.call_later(
+                0.05, self._dispatch_updated_data
+            )
+
+    def _dispatch_updated_data(self) -> None:
+        self._pending_dispatch = None
         self.async_set_updated_data(self.data)
 
     async def _async_update_data(self) -> dict:
@@ -58,29 +83,60 @@ class BlissBlindCoordinator(DataUpdateCoordinator[dict]):
             await self._client.refresh_status()
         except BleakError as err:
             raise UpdateFailed(f"Bluetooth error while updating {self.address}") from err
-        self.data.update(self._client.state)
-        return self.data
+        # Return a fresh dict so the coordinator's unchanged-data check
+        # compares against the previous poll rather than itself.
+        data = {**self.data, **self._client.state}
+        position = data.get("position")
+        data["is_closed"] = None if position is None else position <= 0
+        return data
 
     async def async_set_fraction(self, fraction: float) -> None:
+        # The client pushes the resulting state through the status
+        # callback, so no explicit dispatch is needed here.
         await self._client.set_cover_fraction(fraction)
-        self.data.update(self._client.state)
-        self.async_set_updated_data(self.data)
 
     async def async_set_percentage(self, percentage: int) -> None:
         await self._client.set_cover_percentage(percentage)
-        self.data.update(self._client.state)
-        self.async_set_updated_data(self.data)
+
+    async def async_set_percentage_debounced(self, percentage: int) -> None:
+        """Send only the newest target after a short quiet period.
+
+        A slider drag produces a flurry of set-position calls; each one
+        overwrites the pending percentage and resets a 150ms timer, so a
+        whole gesture collapses into a single BLE command.
+        """
+        self._pending_percent = percentage
+        if self._percent_debounce is not None:
+            self._percent_debounce.cancel()
+        self._percent_debounce = self.hass.loop.call_later(
+            0.15, self._send_pending_percentage
+        )
+
+    def _send_pending_percentage(self) -> None:
+        self._percent_debounce = None
+        percentage = self._pending_percent
+        self._pending_percent = None
+        if percentage is not None:
+            self.hass.async_create_task(self._async_send_percentage(percentage))
+
+    async def _async_send_percentage(self, percentage: int) -> None:
+        try:
+            await self.async_set_percentage(percentage)
+        except BleakError as err:
+            LOGGER.warning("Move command to %s failed: %s", self.address, err)
 
     async def async_open(self) -> None:
-        await self._client.open_cover()
-        self.data.update(self._client.state)
-        self.async_set_updated_data(self.data)
+        await self.async_set_percentage(100)
 
     async def async_close(self) -> None:
-        await self._client.close_cover()
-        self.data.update(self._client.state)
-        self.async_set_updated_data(self.data)
+        await self.async_set_percentage(0)
 
     async def async_shutdown(self) -> None:
+        if self._pending_dispatch is not None:
+            self._pending_dispatch.cancel()
+            self._pending_dispatch = None
+        if self._percent_debounce is not None:
+            self._percent_debounce.cancel()
+            self._percent_debounce = None
         await self._client.disconnect()
         await super().async_shutdown()
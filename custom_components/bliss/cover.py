@@ -1,6 +1,7 @@
 """Cover platform for Bliss blinds."""
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from homeassistant.components.cover import (
@@ -10,6 +11,7 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.const import CONF_DEVICES
+from homeassistant.core import callback
 
 from .const import DOMAIN, LOGGER
 from .coordinator import BlissBlindCoordinator
@@ -20,18 +22,27 @@ COVER_DESCRIPTION = CoverEntityDescription(
     name="Blind",
 )
 
+# Shared fallback for the brief window where coordinator.data is unset;
+# avoids building a fresh dict on every update.
+_EMPTY: dict = {}
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
+    devices_map: dict[str, BlissBlindCoordinator] = hass.data[DOMAIN][CONF_DEVICES]
     entities: list[BlissCoverEntity] = []
-
-    for device_id, _conf in config_entry.data.get(CONF_DEVICES, {}).items():
-        coordinator: BlissBlindCoordinator = hass.data[DOMAIN][CONF_DEVICES][device_id]
+    for device_id in config_entry.data.get(CONF_DEVICES, {}):
+        coordinator = devices_map.get(device_id)
+        if coordinator is None:
+            LOGGER.warning("No coordinator for device %s, skipping", device_id)
+            continue
         entities.append(BlissCoverEntity(coordinator, COVER_DESCRIPTION))
-
     async_add_entities(entities)
 
 
 class BlissCoverEntity(BlissBaseEntity, CoverEntity):
+    __slots__ = ()
+
+    _attr_should_poll = False
     _attr_supported_features = (
         CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.SET_POSITION
     )
@@ -40,35 +51,45 @@ class BlissCoverEntity(BlissBaseEntity, CoverEntity):
         self, coordinator: BlissBlindCoordinator, description: CoverEntityDescription
     ) -> None:
         super().__init__(coordinator, description)
-        self._attr_should_poll = False
+        self._update_attrs_from_coordinator()
 
-    @property
-    def available(self) -> bool:
-        return bool(self.coordinator.data.get("available"))
+    def _update_attrs_from_coordinator(self) -> None:
+        """Unpack coordinator data into plain attributes once per update."""
+        data = self.coordinator.data or _EMPTY
+        self._attr_available = bool(data.get("available"))
+        self._attr_current_cover_position = data.get("position")
+        self._attr_is_closed = data.get("is_closed")
 
-    @property
-    def current_cover_position(self) -> int | None:
-        return self.coordinator.data.get("position")
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_attrs_from_coordinator()
+        super()._handle_coordinator_update()
 
     @property
-    def is_closed(self) -> bool | None:
-        position = self.current_cover_position
-        if position is None:
-            return None
-        return position <= 0
+    def available(self) -> bool:
+        # CoordinatorEntity.available only reflects last_update_success;
+        # combine it with the client-reported flag cached from data.
+        return super().available and self._attr_available
 
     async def async_open_cover(self, **kwargs: Any) -> None:
-        LOGGER.debug("Opening Bliss blind %s", self.coordinator.address)
-        await self.coordinator.async_open()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Opening Bliss blind %s", self.coordinator.address)
+        await self.coordinator.async_set_percentage_debounced(100)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
-        LOGGER.debug("Closing Bliss blind %s", self.coordinator.address)
-        await self.coordinator.async_close()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Closing Bliss blind %s", self.coordinator.address)
+        await self.coordinator.async_set_percentage_debounced(0)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         if ATTR_POSITION not in kwargs:
             return
         position = int(kwargs[ATTR_POSITION])
-        position = max(0, min(100, position))
-        LOGGER.debug("Setting Bliss blind %s to %s%%", self.coordinator.address, position)
-        await self.coordinator.async_set_percentage(position)
+        position = 0 if position < 0 else 100 if position > 100 else position
+        if (self.coordinator.data or _EMPTY).get("position") == position:
+            return
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Setting Bliss blind %s to %s%%", self.coordinator.address, position
+            )
+        await self.coordinator.async_set_percentage_debounced(position)
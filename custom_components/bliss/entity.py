@@ -1,23 +1,32 @@
 """Base entity class for the Bliss integration."""
 from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import BlissBlindCoordinator
+if TYPE_CHECKING:
+    from .coordinator import BlissBlindCoordinator
+
+    _BlissCoordinatorEntity = CoordinatorEntity[BlissBlindCoordinator]
+else:
+    _BlissCoordinatorEntity = CoordinatorEntity
 
 
-class BlissBaseEntity(CoordinatorEntity[BlissBlindCoordinator]):
+class BlissBaseEntity(_BlissCoordinatorEntity):
     """Common base entity for Bliss devices."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator: BlissBlindCoordinator, description: EntityDescription) -> None:
         super().__init__(coordinator)
         self.entity_description = description
 
-        self._attr_name = f"{self.coordinator.device_name} {description.name}"
-        self._attr_unique_id = f"{self.coordinator.address}-{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self.coordinator.address)},
-            "name": self.coordinator.device_name,
-        }
+        # Resolve the description's dataclass fields once up front.
+        key = description.key
+        name = description.name
+        self._attr_name = f"{coordinator.device_name} {name}"
+        self._attr_unique_id = sys.intern(f"{coordinator.address}-{key}")
+        self._attr_device_info = coordinator.device_info_dict